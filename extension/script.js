@@ -136,19 +136,54 @@ async function init() {
 // ============================================================
 // MAIN AUDIT LOOP
 // ============================================================
-async function runAudit() {
+// Coalesce overlapping triggers (poll, FilterChanged, demo controls):
+// while an audit is running, further calls queue a single follow-up run.
+// An audit still pending after a full poll interval is abandoned so a hung
+// Tableau call cannot stop monitoring; its generation no longer matches,
+// so it neither applies results nor clears the newer audit's state.
+let auditInFlight = null;
+let auditQueued = false;
+let auditStartedAt = 0;
+let auditGeneration = 0;
+
+function runAudit() {
+    if (auditInFlight) {
+        if (Date.now() - auditStartedAt < CONFIG.pollInterval) {
+            auditQueued = true;
+            return auditInFlight;
+        }
+        console.warn('⚠️ Audit stalled, abandoning and starting a new one');
+    }
+    const generation = ++auditGeneration;
+    auditQueued = false;
+    auditStartedAt = Date.now();
+    auditInFlight = executeAudit(generation).finally(() => {
+        if (generation !== auditGeneration) return;
+        auditInFlight = null;
+        if (auditQueued) {
+            auditQueued = false;
+            runAudit();
+        }
+    });
+    return auditInFlight;
+}
+
+async function executeAudit(generation) {
     updateUIState('loading');
 
     try {
         let analysisResult;
 
         if (isTableauInitialized && currentWorksheet) {
-            analysisResult = await analyzeWorksheetData();
+            analysisResult = await analyzeWorksheetData(generation);
         } else {
             updateUIState('standalone');
             return;
         }
 
+        // A newer audit took over while this one was stalled
+        if (!analysisResult) return;
+
         checkCount++;
         lastAnalysis = analysisResult;
 
@@ -172,6 +207,7 @@ async function runAudit() {
 
     } catch (error) {
         console.error('❌ Audit Error:', error);
+        if (generation !== auditGeneration) return;
         updateUIState('error', { message: error.message });
     }
 }
@@ -179,7 +215,7 @@ async function runAudit() {
 // ============================================================
 // DATA ANALYSIS - ENSEMBLE ENGINE
 // ============================================================
-async function analyzeWorksheetData() {
+async function analyzeWorksheetData(generation) {
     try { await currentWorksheet.clearSelectedMarksAsync(); } catch (e) { }
 
     let dataTable;
@@ -191,37 +227,22 @@ async function analyzeWorksheetData() {
         dataTable = await currentWorksheet.getSummaryDataAsync();
     }
 
+    // Stale audit: leave value/signal history to the audit that replaced it
+    if (generation !== auditGeneration) return null;
+
     const rows = dataTable.data;
     const columns = dataTable.columns;
 
-    // Auto-detect metric: try candidates in order
-    let metricColIndex = -1;
-    let detectedMetric = null;
-    for (const candidate of CONFIG.heroMetricCandidates) {
-        metricColIndex = findColumnIndex(columns, candidate);
-        if (metricColIndex !== -1) {
-            detectedMetric = candidate;
-            CONFIG.heroMetricField = candidate;
-            CONFIG.heroMetricName = candidate;
-            console.log(`📊 TrustOS: Using metric "${candidate}"`);
-            break;
-        }
-    }
-
-    // Fallback to original config if no candidate found
-    if (metricColIndex === -1) {
-        metricColIndex = findColumnIndex(columns, CONFIG.heroMetricField);
-    }
-
-    if (metricColIndex === -1) {
-        throw new Error(`Metric not found. Tried: ${CONFIG.heroMetricCandidates.join(', ')}`);
-    }
+    const metricColIndex = resolveMetricColumn(columns);
 
-    let values = [];
+    // Extract the metric column once into a packed numeric array
+    const column = new Float64Array(rows.length);
+    let count = 0;
     for (const row of rows) {
         const val = extractNumericValue(row[metricColIndex]);
-        if (!isNaN(val)) values.push(val);
+        if (!isNaN(val)) column[count++] = val;
     }
+    const values = column.subarray(0, count);
 
     if (values.length === 0) throw new Error('No numeric values found');
 
@@ -242,10 +263,12 @@ async function analyzeWorksheetData() {
     valueHistory.push(latestValue);
     if (valueHistory.length > 10) valueHistory.shift();
 
+    const zScore = Math.abs((latestValue - stats.mean) * stats.invStd);
+
     // ========================================
     // RUN ALL DETECTORS
     // ========================================
-    const signals = runAllDetectors(latestValue, previousValue, stats, values, duplicateInfo);
+    const signals = runAllDetectors(latestValue, previousValue, zScore, stats, values, duplicateInfo);
 
     signalHistory.push(signals.length);
     if (signalHistory.length > CONFIG.persistenceWindow) signalHistory.shift();
@@ -253,7 +276,39 @@ async function analyzeWorksheetData() {
     // ========================================
     // CALCULATE ENSEMBLE TRUST SCORE
     // ========================================
-    return calculateEnsembleTrustScore(latestValue, stats, signals, duplicateInfo);
+    return calculateEnsembleTrustScore(latestValue, zScore, stats, signals, duplicateInfo);
+}
+
+// Resolved metric column, reused while the worksheet column layout is unchanged
+let metricColumnCache = { layout: null, index: -1 };
+
+function resolveMetricColumn(columns) {
+    const layout = columns.map(col => col.fieldName).join('|');
+    if (metricColumnCache.layout === layout) return metricColumnCache.index;
+
+    // Auto-detect metric: try candidates in order
+    let metricColIndex = -1;
+    for (const candidate of CONFIG.heroMetricCandidates) {
+        metricColIndex = findColumnIndex(columns, candidate);
+        if (metricColIndex !== -1) {
+            CONFIG.heroMetricField = candidate;
+            CONFIG.heroMetricName = candidate;
+            console.log(`📊 TrustOS: Using metric "${candidate}"`);
+            break;
+        }
+    }
+
+    // Fallback to original config if no candidate found
+    if (metricColIndex === -1) {
+        metricColIndex = findColumnIndex(columns, CONFIG.heroMetricField);
+    }
+
+    if (metricColIndex === -1) {
+        throw new Error(`Metric not found. Tried: ${CONFIG.heroMetricCandidates.join(', ')}`);
+    }
+
+    metricColumnCache = { layout, index: metricColIndex };
+    return metricColIndex;
 }
 
 // ============================================================
@@ -263,23 +318,26 @@ function detectDuplicateRows(rows) {
     if (!rows || rows.length < 2) return { hasDuplicates: false, duplicateCount: 0, duplicateRatio: 0 };
 
     const rowHashes = new Set();
-    const duplicates = [];
+    let duplicateCount = 0;
 
-    for (let i = 0; i < rows.length; i++) {
-        // Create hash from all cell values
-        const hash = rows[i].map(cell => cell?.value ?? cell?.formattedValue ?? '').join('|');
-        if (rowHashes.has(hash)) {
-            duplicates.push(i);
-        } else {
-            rowHashes.add(hash);
+    for (const row of rows) {
+        // Create hash from all cell values (built in place, no per-row temp array)
+        let hash = '';
+        for (let c = 0; c < row.length; c++) {
+            const cell = row[c];
+            if (c > 0) hash += '|';
+            hash += cell?.value ?? cell?.formattedValue ?? '';
         }
+        const sizeBefore = rowHashes.size;
+        rowHashes.add(hash);
+        if (rowHashes.size === sizeBefore) duplicateCount++;
     }
 
-    const duplicateRatio = duplicates.length / rows.length;
+    const duplicateRatio = duplicateCount / rows.length;
 
     return {
-        hasDuplicates: duplicates.length > 0,
-        duplicateCount: duplicates.length,
+        hasDuplicates: duplicateCount > 0,
+        duplicateCount: duplicateCount,
         duplicateRatio: duplicateRatio,
         totalRows: rows.length,
         uniqueRows: rowHashes.size
@@ -289,11 +347,12 @@ function detectDuplicateRows(rows) {
 // ============================================================
 // SIGNAL DETECTORS (Ensemble Architecture)
 // ============================================================
-function runAllDetectors(latestValue, previousValue, stats, allValues, duplicateInfo) {
+function runAllDetectors(latestValue, previousValue, zScore, stats, allValues, duplicateInfo) {
     const signals = [];
-    const zScore = Math.abs(latestValue - stats.mean) / (stats.std || 1);
     const multiplier = latestValue / stats.mean;
     const threshold = getActiveThreshold();
+    const criticalZone = threshold * 1.5;
+    const warningZone = threshold * 0.7;
 
     // ========================================
     // STATISTICAL DETECTORS (40% weight)
@@ -304,7 +363,7 @@ function runAllDetectors(latestValue, previousValue, stats, allValues, duplicate
         signals.push({
             type: 'Z_SCORE',
             category: 'STATISTICAL',
-            severity: zScore > threshold * 1.5 ? 'CRITICAL' : 'HIGH',
+            severity: zScore > criticalZone ? 'CRITICAL' : 'HIGH',
             value: zScore,
             message: `Z-Score ${zScore.toFixed(1)} exceeds threshold ${threshold}`,
             icon: '📊'
@@ -312,7 +371,6 @@ function runAllDetectors(latestValue, previousValue, stats, allValues, duplicate
     }
 
     // Signal 2: High Z-Score Warning
-    const warningZone = threshold * 0.7;
     if (zScore > warningZone && zScore <= threshold) {
         signals.push({
             type: 'HIGH_ZSCORE',
@@ -435,9 +493,7 @@ function runAllDetectors(latestValue, previousValue, stats, allValues, duplicate
 // ============================================================
 // ENSEMBLE TRUST SCORE CALCULATION
 // ============================================================
-function calculateEnsembleTrustScore(latestValue, stats, signals, duplicateInfo) {
-    const zScore = Math.abs(latestValue - stats.mean) / (stats.std || 1);
-
+function calculateEnsembleTrustScore(latestValue, zScore, stats, signals, duplicateInfo) {
     // Start with 100 (perfect trust)
     let trustScore = 100;
 
@@ -538,19 +594,24 @@ function generateFingerprint(signals) {
     const high = signals.find(s => s.severity === 'HIGH');
     const primary = critical || high || signals[0];
 
-    // Voting summary: which detectors voted and how
+    // Voting summary: which detectors voted and how (single pass over signals)
     const votingSummary = {
         total: signals.length,
-        critical: signals.filter(s => s.severity === 'CRITICAL').length,
-        high: signals.filter(s => s.severity === 'HIGH').length,
-        medium: signals.filter(s => s.severity === 'MEDIUM').length,
-        low: signals.filter(s => s.severity === 'LOW').length,
+        critical: 0,
+        high: 0,
+        medium: 0,
+        low: 0,
         categories: {
-            STATISTICAL: signals.filter(s => s.category === 'STATISTICAL').length,
-            BUSINESS: signals.filter(s => s.category === 'BUSINESS').length,
-            TEMPORAL: signals.filter(s => s.category === 'TEMPORAL').length
+            STATISTICAL: 0,
+            BUSINESS: 0,
+            TEMPORAL: 0
         }
     };
+    const severityKeys = { CRITICAL: 'critical', HIGH: 'high', MEDIUM: 'medium', LOW: 'low' };
+    for (const s of signals) {
+        if (Object.prototype.hasOwnProperty.call(severityKeys, s.severity)) votingSummary[severityKeys[s.severity]]++;
+        if (Object.prototype.hasOwnProperty.call(votingSummary.categories, s.category)) votingSummary.categories[s.category]++;
+    }
 
     return {
         pattern: primary.type,
@@ -569,34 +630,36 @@ function generateFingerprint(signals) {
     };
 }
 
+const ROOT_CAUSES = {
+    'Z_SCORE': 'Statistical outlier - investigate data source',
+    'HIGH_ZSCORE': 'Value approaching anomaly threshold',
+    'BUSINESS_RULE': 'Value outside business-valid range',
+    'RATE_OF_CHANGE': 'Sudden change - check recent data loads',
+    'DUPLICATE_INFLATION': 'Possible duplicate rows from JOIN issues',
+    'CURRENCY_FLIP': 'Possible currency conversion error',
+    'DECIMAL_SHIFT': 'Check ETL unit/decimal conversions',
+    'NEGATIVE_VALUE': 'Unexpected negative - check calculation logic',
+    'DUPLICATE_ROWS': 'Actual duplicate rows detected in data'
+};
+
+const RECOMMENDED_ACTIONS = {
+    'Z_SCORE': '🔍 Query raw data, compare to historical baseline',
+    'HIGH_ZSCORE': '📊 Monitor closely, consider lowering threshold',
+    'BUSINESS_RULE': '📋 Verify data source, check filter conditions',
+    'RATE_OF_CHANGE': '🔄 Check recent ETL jobs, verify data refresh timestamp',
+    'DUPLICATE_INFLATION': '🔗 Audit JOIN conditions, check for fanout',
+    'CURRENCY_FLIP': '💱 Verify currency field mapping in ETL',
+    'DECIMAL_SHIFT': '🔢 Check number format and unit conversions',
+    'NEGATIVE_VALUE': '➖ Review calculation logic, check for sign flips',
+    'DUPLICATE_ROWS': '📋 Run SELECT DISTINCT, check primary keys'
+};
+
 function getRootCause(signalType) {
-    const causes = {
-        'Z_SCORE': 'Statistical outlier - investigate data source',
-        'HIGH_ZSCORE': 'Value approaching anomaly threshold',
-        'BUSINESS_RULE': 'Value outside business-valid range',
-        'RATE_OF_CHANGE': 'Sudden change - check recent data loads',
-        'DUPLICATE_INFLATION': 'Possible duplicate rows from JOIN issues',
-        'CURRENCY_FLIP': 'Possible currency conversion error',
-        'DECIMAL_SHIFT': 'Check ETL unit/decimal conversions',
-        'NEGATIVE_VALUE': 'Unexpected negative - check calculation logic',
-        'DUPLICATE_ROWS': 'Actual duplicate rows detected in data'
-    };
-    return causes[signalType] || 'Manual investigation required';
+    return ROOT_CAUSES[signalType] || 'Manual investigation required';
 }
 
 function getRecommendedAction(signalType) {
-    const actions = {
-        'Z_SCORE': '🔍 Query raw data, compare to historical baseline',
-        'HIGH_ZSCORE': '📊 Monitor closely, consider lowering threshold',
-        'BUSINESS_RULE': '📋 Verify data source, check filter conditions',
-        'RATE_OF_CHANGE': '🔄 Check recent ETL jobs, verify data refresh timestamp',
-        'DUPLICATE_INFLATION': '🔗 Audit JOIN conditions, check for fanout',
-        'CURRENCY_FLIP': '💱 Verify currency field mapping in ETL',
-        'DECIMAL_SHIFT': '🔢 Check number format and unit conversions',
-        'NEGATIVE_VALUE': '➖ Review calculation logic, check for sign flips',
-        'DUPLICATE_ROWS': '📋 Run SELECT DISTINCT, check primary keys'
-    };
-    return actions[signalType] || '🔍 Investigate manually';
+    return RECOMMENDED_ACTIONS[signalType] || '🔍 Investigate manually';
 }
 
 function propagateTrust(heroMetric, isSafe) {
@@ -608,9 +671,20 @@ function propagateTrust(heroMetric, isSafe) {
 // ============================================================
 // HELPERS
 // ============================================================
+// Normalized field names are stable across audits, so memoize them
+const normalizedNameCache = new Map();
+function normalizeFieldName(name) {
+    let clean = normalizedNameCache.get(name);
+    if (clean === undefined) {
+        clean = name.toLowerCase().replace(/[^a-z0-9]/g, '');
+        normalizedNameCache.set(name, clean);
+    }
+    return clean;
+}
+
 function findColumnIndex(columns, fieldName) {
-    const cleanTarget = fieldName.toLowerCase().replace(/[^a-z0-9]/g, '');
-    return columns.findIndex(col => col.fieldName.toLowerCase().replace(/[^a-z0-9]/g, '').includes(cleanTarget));
+    const cleanTarget = normalizeFieldName(fieldName);
+    return columns.findIndex(col => normalizeFieldName(col.fieldName).includes(cleanTarget));
 }
 
 function extractNumericValue(cell) {
@@ -621,19 +695,38 @@ function extractNumericValue(cell) {
     return NaN;
 }
 
+// Welford online aggregate: mean and M2 in a single pass, no temp arrays
 function calculateStatistics(values) {
-    const n = values.length;
-    const mean = values.reduce((a, b) => a + b, 0) / n;
-    const variance = values.map(v => Math.pow(v - mean, 2)).reduce((a, b) => a + b, 0) / n;
-    return { mean, std: Math.sqrt(variance), count: n };
+    let n = 0;
+    let mean = 0;
+    let m2 = 0;
+    for (const x of values) {
+        n++;
+        const delta = x - mean;
+        mean += delta / n;
+        m2 += delta * (x - mean);
+    }
+    const std = Math.sqrt(m2 / n);
+    return { mean, std, invStd: 1 / (std || 1), count: n };
 }
 
 // ============================================================
 // UI UPDATES
 // ============================================================
+// The extension markup is static, so element lookups are cached after the first hit
+const elementCache = new Map();
+function queryElement(selector) {
+    let el = elementCache.get(selector);
+    if (!el) {
+        el = document.querySelector(selector);
+        if (el) elementCache.set(selector, el);
+    }
+    return el;
+}
+
 function updateUIState(state, data = {}) {
-    const safetyOverlay = document.getElementById('safety-overlay');
-    const alertMessage = document.getElementById('alert-message');
+    const safetyOverlay = queryElement('#safety-overlay');
+    const alertMessage = queryElement('#alert-message');
 
     safetyOverlay.classList.remove('active');
 
@@ -655,12 +748,12 @@ function updateUIState(state, data = {}) {
             alertMessage.textContent = data.message;
             safetyOverlay.classList.add('active');
 
-            document.getElementById('safety-message').textContent = data.message;
+            queryElement('#safety-message').textContent = data.message;
             if (data.fingerprint && data.fingerprint.description) {
-                document.getElementById('safety-fingerprint-desc').textContent = data.fingerprint.description;
+                queryElement('#safety-fingerprint-desc').textContent = data.fingerprint.description;
             }
             if (data.propagation && data.propagation.message) {
-                document.getElementById('safety-propagation-msg').textContent = data.propagation.message;
+                queryElement('#safety-propagation-msg').textContent = data.propagation.message;
             }
             break;
         case 'standalone':
@@ -678,10 +771,10 @@ function updateUIState(state, data = {}) {
 }
 
 function setHeroState(state, icon, text) {
-    const hero = document.querySelector('.status-hero');
-    const heroIcon = document.querySelector('.hero-icon');
-    const heroText = document.getElementById('status-text');
-    const badgeStatus = document.querySelector('.brand-status');
+    const hero = queryElement('.status-hero');
+    const heroIcon = queryElement('.hero-icon');
+    const heroText = queryElement('#status-text');
+    const badgeStatus = queryElement('.brand-status');
 
     document.body.className = `state-${state}`;
     if (hero) {
@@ -701,7 +794,7 @@ function updateStats(data) {
     setText('stat-baseline', `${data.mean.toFixed(0)}%`);
     setText('confidence-value', `${data.trustScore.toFixed(0)}/100`);
 
-    const meter = document.getElementById('meter-fill');
+    const meter = queryElement('#meter-fill');
     if (meter) {
         meter.style.width = `${data.trustScore}%`;
         meter.style.background = data.trustScore >= 80 ? 'var(--c-safe)' : data.trustScore >= 50 ? 'var(--c-warn)' : 'var(--c-danger)';
@@ -709,7 +802,7 @@ function updateStats(data) {
 }
 
 function updateTimelineUI() {
-    const container = document.getElementById('trust-timeline');
+    const container = queryElement('#trust-timeline');
     if (!container) return;
 
     container.innerHTML = trustTimeline.map(e => `
@@ -724,8 +817,8 @@ function updateTimelineUI() {
 
 // Detector Contribution Bars (shows which signals impacted Trust Score)
 function updateContributionBars(signals, categoryBreakdown) {
-    const container = document.getElementById('contribution-bars');
-    const panel = document.getElementById('contribution-panel');
+    const container = queryElement('#contribution-bars');
+    const panel = queryElement('#contribution-panel');
     if (!container || !panel) return;
 
     if (!signals || signals.length === 0) {
@@ -762,7 +855,7 @@ function updateContributionBars(signals, categoryBreakdown) {
 // Trust Score Sparkline (last 10 evaluations)
 let trustScoreHistory = [];
 function updateSparkline(trustScore) {
-    const container = document.getElementById('trust-sparkline');
+    const container = queryElement('#trust-sparkline');
     if (!container) return;
 
     // Store history
@@ -781,7 +874,7 @@ function updateSparkline(trustScore) {
 }
 
 function updateNovelInsightsUI(data) {
-    const fpPanel = document.getElementById('fingerprint-panel');
+    const fpPanel = queryElement('#fingerprint-panel');
     if (fpPanel) {
         if (data.fingerprint) {
             fpPanel.classList.remove('hidden');
@@ -818,7 +911,7 @@ function updateNovelInsightsUI(data) {
         setText('prediction-message', 'No anomalies detected');
     }
 
-    const propPanel = document.getElementById('propagation-panel');
+    const propPanel = queryElement('#propagation-panel');
     if (propPanel) {
         if (data.propagation && !data.isSafe) {
             propPanel.classList.remove('hidden');
@@ -830,18 +923,56 @@ function updateNovelInsightsUI(data) {
 }
 
 function setText(id, text) {
-    const el = document.getElementById(id);
+    const el = queryElement(`#${id}`);
     if (el) el.textContent = text;
 }
 
+// Safety parameter handle, resolved once and refreshed on ParameterChanged.
+// At most one listener is registered; it is removed before re-resolving.
+let safetyParameter = null;
+let removeSafetyParameterListener = null;
+
+function dropSafetyParameter() {
+    if (removeSafetyParameterListener) {
+        removeSafetyParameterListener();
+        removeSafetyParameterListener = null;
+    }
+    safetyParameter = null;
+}
+
+async function getSafetyParameter() {
+    if (safetyParameter) return safetyParameter;
+    dropSafetyParameter();
+    const dashboard = tableau.extensions.dashboardContent.dashboard;
+    const params = await dashboard.getParametersAsync();
+    const p = params.find(param => param.name === CONFIG.safetyParameter);
+    if (p) {
+        removeSafetyParameterListener = p.addEventListener(tableau.TableauEventType.ParameterChanged, async (event) => {
+            try {
+                const updated = await event.getParameterAsync();
+                // Ignore late events after the handle has been dropped
+                if (safetyParameter) safetyParameter = updated;
+            } catch (e) {
+                // Cached currentValue may now be stale; re-resolve and re-assert next audit
+                dropSafetyParameter();
+                console.error('Param refresh failed', e);
+            }
+        });
+        safetyParameter = p;
+    }
+    return p;
+}
+
 async function setTableauParameter(isSafe) {
     if (!isTableauInitialized) return;
     try {
-        const dashboard = tableau.extensions.dashboardContent.dashboard;
-        const params = await dashboard.getParametersAsync();
-        const p = params.find(param => param.name === CONFIG.safetyParameter);
-        if (p) await p.changeValueAsync(isSafe);
-    } catch (e) { console.error('Param update failed', e); }
+        const p = await getSafetyParameter();
+        // Skip the write round-trip when the trust state is unchanged
+        if (p && p.currentValue?.value !== isSafe) await p.changeValueAsync(isSafe);
+    } catch (e) {
+        dropSafetyParameter();
+        console.error('Param update failed', e);
+    }
 }
 
 // ============================================================